@@ -5,21 +5,165 @@ Research Assistant Agent using smolagents
 A simple agent that can search the web and answer questions.
 
 Run with: python research_agent.py
+Batch mode: python research_agent.py --batch "task one" "task two" ...
 
 Requirements: pip install smolagents python-dotenv
 """
 
+import argparse
+import asyncio
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import ClassVar
 from dotenv import load_dotenv
 from smolagents import (
     CodeAgent,
     DuckDuckGoSearchTool,
     InferenceClientModel,
 )
+from smolagents.utils import AgentMaxStepsError
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Optional, increases rate limits for the free Inference API
+HF_TOKEN = os.getenv("HF_TOKEN")
+MODEL_ID = "Qwen/Qwen2.5-72B-Instruct"
+
+# Queries with these words go stale quickly, so their cached results expire sooner
+FRESH_QUERY_WORDS = frozenset({"latest", "news", "today", "current", "weather", "price"})
+SEARCH_CACHE_SIZE = 256
+
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+# Results of recent interactive tasks: normalized task -> (expiry in s, result)
+TASK_CACHE_TTL_S = 1800
+TASK_CACHE_SIZE = 64
+_task_cache = OrderedDict()
+
+# Rerun the previous task, skipping the cache
+REFRESH_COMMAND = "/refresh"
+
+
+class CachedDuckDuckGoSearchTool(DuckDuckGoSearchTool):
+    """DuckDuckGo search that reuses results for repeated queries."""
+
+    # normalized query -> (expiry in ns, result), shared by every agent.
+    # Batch mode searches from several threads, hence the lock.
+    _cache: ClassVar[OrderedDict[str, tuple[int, str]]] = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def forward(self, query: str) -> str:
+        key = " ".join(query.lower().split())
+        now = time.time_ns()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit and hit[0] > now:
+                self._cache.move_to_end(key)
+                return hit[1]
+            if hit:
+                del self._cache[key]
+
+        result = super().forward(query)
+        words = re.findall(r"\w+", key)
+        ttl_s = 600 if FRESH_QUERY_WORDS.intersection(words) else 86_400
+        with self._cache_lock:
+            self._cache[key] = (now + ttl_s * 1_000_000_000, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > SEARCH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+
+@lru_cache(maxsize=4)
+def get_hf_model(model_id, token):
+    """Return a shared Hugging Face Inference API model instead of rebuilding it."""
+    return InferenceClientModel(model_id=model_id, token=token)
+
+
+def create_agent(verbosity_level=2, model=None):
+    """Create a research agent with web search."""
+    # Use free Hugging Face Inference API
+    if model is None:
+        model = get_hf_model(MODEL_ID, HF_TOKEN)
+
+    return CodeAgent(
+        model=model,
+        tools=[CachedDuckDuckGoSearchTool()],
+        max_steps=10,  # Limit reasoning steps
+        verbosity_level=verbosity_level,  # 0=quiet, 1=normal, 2=verbose
+        stream_outputs=verbosity_level > 0,  # Show model output as it's generated
+    )
+
+
+async def run_batch(tasks, concurrency=4):
+    """Run several research tasks concurrently, one agent per task."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run_one(task):
+        async with sem:
+            # Agents keep per-run memory and models keep per-call token counts,
+            # so each concurrent task gets its own of both
+            model = InferenceClientModel(model_id=MODEL_ID, token=HF_TOKEN)
+            agent = create_agent(verbosity_level=0, model=model)
+            return await asyncio.to_thread(agent.run, task)
+
+    return await asyncio.gather(
+        *(run_one(task) for task in tasks), return_exceptions=True
+    )
+
+
+def task_cache_key(task):
+    """Normalize a task so case and whitespace differences share a cache entry."""
+    return " ".join(task.lower().split())
+
+
+def get_cached_result(key):
+    """Return the (expiry, result) entry for a recent task, or None."""
+    hit = _task_cache.get(key)
+    if hit is None:
+        return None
+    if hit[0] <= time.time():
+        del _task_cache[key]
+        return None
+    _task_cache.move_to_end(key)
+    return hit
+
+
+def run_and_cache(agent, task, key):
+    """Run a task and remember its result, unless the agent gave up."""
+    result = agent.run(task)
+
+    # After max_steps smolagents still returns a best-effort answer; don't
+    # keep it, so retyping the task gets a real rerun
+    last_step = agent.memory.steps[-1] if agent.memory.steps else None
+    if isinstance(getattr(last_step, "error", None), AgentMaxStepsError):
+        _task_cache.pop(key, None)
+        return result
+
+    _task_cache[key] = (time.time() + TASK_CACHE_TTL_S, result)
+    _task_cache.move_to_end(key)
+    if len(_task_cache) > TASK_CACHE_SIZE:
+        _task_cache.popitem(last=False)
+    return result
+
+
+def main_batch(tasks):
+    """Run tasks given on the command line without the interactive prompt."""
+    results = asyncio.run(run_batch(tasks))
+    for task, result in zip(tasks, results):
+        print("=" * 60)
+        print(f"🎯 {task}")
+        print("-" * 60)
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}")
+        else:
+            print(result)
+
 
 def main():
     """Run the interactive research assistant."""
@@ -30,40 +174,49 @@ def main():
 
     print()
 
-    # Create agent - use free Hugging Face Inference API
-    model = InferenceClientModel(
-        model_id="Qwen/Qwen2.5-72B-Instruct",
-        token=os.getenv("HF_TOKEN"),  # Optional, increases rate limits
-    )
-
     # Create the agent with web search
-    agent = CodeAgent(
-        model=model,
-        tools=[DuckDuckGoSearchTool()],
-        max_steps=10,  # Limit reasoning steps
-        verbosity_level=2,  # Show detailed reasoning (0=quiet, 1=normal, 2=verbose)
-    )
+    agent = create_agent()
 
     print()
 
     # Interactive loop
+    last_task = None
     while True:
         print("-" * 60)
         task = input("🎯 Enter your research task (or 'quit' to exit): ").strip()
 
-        if task.lower() in ("quit", "exit", "q"):
+        if task.lower() in QUIT_COMMANDS:
             print("👋 Goodbye!")
             break
 
+        refresh = task.lower() == REFRESH_COMMAND
+        if refresh:
+            if last_task is None:
+                print("ℹ️ Nothing to rerun yet.")
+                continue
+            task = last_task
+
         if not task:
             continue
+        last_task = task
+
+        key = task_cache_key(task)
+        if refresh:
+            _task_cache.pop(key, None)
+        hit = get_cached_result(key)
+        if hit is not None:
+            print("=" * 60)
+            print(f"📊 FINAL RESULT (cached, type '{REFRESH_COMMAND}' to rerun):")
+            print("-" * 60)
+            print(hit[1])
+            continue
 
         print()
         print("🚀 Starting research...")
         print("=" * 60)
 
         try:
-            result = agent.run(task)
+            result = run_and_cache(agent, task, key)
             print("=" * 60)
             print("📊 FINAL RESULT:")
             print("-" * 60)
@@ -72,5 +225,21 @@ def main():
             print(f"❌ Error: {e}")
 
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Research Assistant Agent")
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="TASK",
+        help="run these tasks concurrently instead of the interactive prompt",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.batch:
+        main_batch(args.batch)
+    else:
+        main()